@@ -1,10 +1,33 @@
 from ipykernel.kernelbase import Kernel
 from .wrapper import BosqueWrapper, BosqueExecutionError
 import os
+import atexit
+import signal
 import tempfile
 import shutil
 import logging
 
+# Under `python -m bosque_kernel.kernel` __name__ is '__main__'; use the module's
+# real name so the logger stays under the 'bosque_kernel' hierarchy
+logger = logging.getLogger(__spec__.name if __spec__ is not None else __name__)
+logger.addHandler(logging.NullHandler())
+
+
+def _fast_rmtree(path):
+    """
+    Removes a directory tree with plain os.scandir/os.unlink/os.rmdir calls.
+
+    :param path: The directory to remove.
+    :raises FileNotFoundError: If path does not exist.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
 
 class BosqueKernel(Kernel):
     """
@@ -31,40 +54,56 @@ class BosqueKernel(Kernel):
         self.temp_dir = None
 
         try:
-            self.bosque = BosqueWrapper()
-
             # Create a temporary directory for execution
             try:
-                self.temp_dir = tempfile.mkdtemp(prefix='bosque_kernel_')
-                logging.debug(f"Temporary directory created at {self.temp_dir}")
+                self.temp_dir = tempfile.mkdtemp(prefix='bosque_kernel_', dir=self._temp_root())
+                logger.debug("Temporary directory created at %s", self.temp_dir)
+                # Make sure the directory goes away even if do_shutdown is never called
+                atexit.register(shutil.rmtree, self.temp_dir, ignore_errors=True)
             except Exception as e:
-                logging.error(f"Failed to create temporary directory: {e}")
+                logger.error("Failed to create temporary directory: %s", e)
                 raise RuntimeError("Cannot create temporary directory.")
 
             # Log environment variables
-            path = os.environ.get('PATH', '')
-            logging.debug(f"Environment PATH: {path}")
+            logger.debug("Environment PATH: %s", os.environ.get('PATH', ''))
 
             # Check if 'bosque' is accessible
-            bosque_path = shutil.which('bosque')
-            if not bosque_path:
+            self._bosque_path = shutil.which('bosque')
+            if not self._bosque_path:
                 raise RuntimeError("'bosque' executable not found in PATH.")
-            logging.debug(f"'bosque' executable found at: {bosque_path}")
+            logger.debug("'bosque' executable found at: %s", self._bosque_path)
 
             # Check if 'node' is accessible
-            node_path = shutil.which('node')
-            if not node_path:
+            self._node_path = shutil.which('node')
+            if not self._node_path:
                 raise RuntimeError("'node' executable not found in PATH.")
-            logging.debug(f"'node' executable found at: {node_path}")
+            logger.debug("'node' executable found at: %s", self._node_path)
 
-        except Exception as e:
-            logging.exception("Failed to initialize BosqueKernel")
-            raise es
+            # Hand the resolved paths to the wrapper so PATH is not searched per cell
+            self.bosque = BosqueWrapper(bosque_command=self._bosque_path,
+                                        node_command=self._node_path,
+                                        work_dir=self.temp_dir)
 
-    def do_execute(self, code, silent=False, store_history=True,
-                   user_expressions=None, allow_stdin=False):
+        except Exception:
+            logger.exception("Failed to initialize BosqueKernel")
+            raise
+
+    @staticmethod
+    def _temp_root():
+        """
+        Picks the parent of the kernel's temporary directory: the RAM-backed
+        /dev/shm on Linux, unless TMPDIR is set explicitly.
+
+        :return: Directory path, or None to use tempfile's default.
+        """
+        if 'TMPDIR' not in os.environ and os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+            return '/dev/shm'
+        return None
+
+    async def do_execute(self, code, silent=False, store_history=True,
+                         user_expressions=None, allow_stdin=False):
         """
-        Executes the Bosque code synchronously.
+        Executes the Bosque code without blocking the kernel's event loop.
 
         :param code: The code to execute.
         :param silent: If True, do not send any output.
@@ -73,35 +112,16 @@ class BosqueKernel(Kernel):
         if not silent:
             # Signal that execution is starting
             self.send_response(self.iopub_socket, 'status', {'execution_state': 'busy'})
-            logging.debug("Kernel is busy executing code.")
+            logger.debug("Kernel is busy executing code.")
 
         try:
-            # Change to the temporary directory
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(self.temp_dir)
-                logging.debug(f"Changed working directory to {self.temp_dir}")
-            except OSError as e:
-                logging.error(f"Error changing working directory: {e}")
-                raise RuntimeError("Failed to change working directory.")
-
-            # Compile and execute Bosque code
-            output = self._compile_and_execute(code)
-            logging.debug("Code compiled and executed successfully.")
-
-            if not silent:
-                # Send the output to the frontend
-                stream_content = {'name': 'stdout', 'text': output}
-                self.send_response(self.iopub_socket, 'stream', stream_content)
-                logging.debug("Output sent to frontend.")
-
-            # Restore the original working directory
-            os.chdir(original_cwd)
-            logging.debug(f"Restored working directory to {original_cwd}")
+            # Compile and execute Bosque code, streaming output to the frontend
+            await self._compile_and_execute(code, on_line=None if silent else self.send_stdout)
+            logger.debug("Code compiled and executed successfully.")
 
             if not silent:
                 self.send_response(self.iopub_socket, 'status', {'execution_state': 'idle'})
-                logging.debug("Kernel status set to idle.")
+                logger.debug("Kernel status set to idle.")
 
             return {'status': 'ok',
                     'execution_count': self.execution_count,
@@ -112,11 +132,7 @@ class BosqueKernel(Kernel):
             # Send the error message to the frontend
             if not silent:
                 self.send_error(e)
-            logging.error(f"BosqueExecutionError: {e}")
-
-            # Restore the original working directory
-            os.chdir(original_cwd)
-            logging.debug(f"Restored working directory to {original_cwd}")
+            logger.error("BosqueExecutionError: %s", e)
 
             return {'status': 'error',
                     'execution_count': self.execution_count,
@@ -128,11 +144,7 @@ class BosqueKernel(Kernel):
             # Handle unexpected exceptions
             if not silent:
                 self.send_error(e)
-            logging.error(f"Unexpected error: {e}", exc_info=True)
-
-            # Restore the original working directory
-            os.chdir(original_cwd)
-            logging.debug(f"Restored working directory to {original_cwd}")
+            logger.error("Unexpected error: %s", e, exc_info=True)
 
             return {'status': 'error',
                     'execution_count': self.execution_count,
@@ -140,20 +152,38 @@ class BosqueKernel(Kernel):
                     'evalue': str(e),
                     'traceback': []}
 
-    def _compile_and_execute(self, code):
+    async def _compile_and_execute(self, code, on_line=None):
         """
         Compiles and executes Bosque code within the temporary directory.
 
         :param code: The Bosque code to execute.
-        :return: The standard output from execution.
+        :param on_line: Optional callback receiving standard output as it is produced.
+        :return: The standard output from execution, or '' if it was passed to on_line.
         :raises BosqueExecutionError: If compilation or execution fails.
         """
+        # Route SIGINT (the interrupt button) to the running compiler or program
         try:
-            logging.debug("Starting compilation and execution of Bosque code.")
-            return self.bosque.compile_and_execute(code, work_dir=self.temp_dir)
+            previous_handler = signal.signal(signal.SIGINT, lambda signum, frame: self.do_interrupt())
+        except ValueError:
+            # Not on the main thread; leave interrupt handling to ipykernel
+            previous_handler = None
+
+        try:
+            return await self.bosque.compile_and_execute_async(code, on_line=on_line)
         except Exception as e:
-            logging.error(f"Error during Bosque execution: {e}")
+            logger.error("Error during Bosque execution: %s", e)
             raise BosqueExecutionError(f"Execution failed: {str(e)}")
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGINT, previous_handler)
+
+    def do_interrupt(self):
+        """
+        Stops the Bosque compilation or execution currently in progress.
+        """
+        logger.debug("Interrupting Bosque execution.")
+        self.bosque.interrupt()
+
     def do_kernel_info_request(self, stream, ident, parent):
         content = {
             'status': 'ok',
@@ -165,6 +195,14 @@ class BosqueKernel(Kernel):
         }
         self.session.send(stream, 'kernel_info_reply', content, parent, ident)
 
+    def send_stdout(self, text):
+        """
+        Sends a chunk of standard output to the Jupyter frontend.
+
+        :param text: The text to send.
+        """
+        self.send_response(self.iopub_socket, 'stream', {'name': 'stdout', 'text': text})
+
     def send_error(self, exception):
         """
         Sends an error message to the Jupyter frontend.
@@ -181,7 +219,7 @@ class BosqueKernel(Kernel):
             'traceback': traceback
         }
         self.send_response(self.iopub_socket, 'error', error_content)
-        logging.debug(f"Error sent to frontend: {ename} - {evalue}")
+        logger.debug("Error sent to frontend: %s - %s", ename, evalue)
 
     def do_shutdown(self, restart):
         """
@@ -189,23 +227,34 @@ class BosqueKernel(Kernel):
 
         :param restart: Whether the kernel should restart.
         """
+        # Stop the Node.js worker
+        if getattr(self, 'bosque', None) is not None:
+            self.bosque.close()
+            logger.debug("Node.js worker stopped.")
+
         # Clean up the temporary directory
         if self.temp_dir:
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
-            logging.debug(f"Temporary directory {self.temp_dir} removed.")
+            try:
+                _fast_rmtree(self.temp_dir)
+                logger.debug("Temporary directory %s removed.", self.temp_dir)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                logger.exception("Failed to remove temporary directory %s", self.temp_dir)
         super().do_shutdown(restart)
 
 def main():
     import logging
     import sys
 
-    # Configure logging to output to stderr
+    # Configure logging to output to stderr, with debug output only from this
+    # package so traitlets, zmq and friends stay at their default level
     logging.basicConfig(
-        level=logging.DEBUG,
         format='%(asctime)s - %(levelname)s - %(message)s',
         stream=sys.stderr
     )
-    logging.debug("Launching BosqueKernel...")
+    logging.getLogger('bosque_kernel').setLevel(logging.DEBUG)
+    logger.debug("Launching BosqueKernel...")
 
     from ipykernel.kernelapp import IPKernelApp
     IPKernelApp.launch_instance(kernel_class=BosqueKernel)
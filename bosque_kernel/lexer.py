@@ -1,5 +1,5 @@
-from pygments.lexer import RegexLexer, bygroups
-from pygments.token import Text, Comment, Keyword, Name, Operator, Punctuation, String, Number, Constant
+from pygments.lexer import RegexLexer, bygroups, words
+from pygments.token import Text, Comment, Keyword, Name, Operator, Punctuation, String, Number
 
 # Based on https://github.com/BosqueLanguage/bosque-language-tools/blob/main/syntaxes/bosque.tmLanguage.json 
 
@@ -21,21 +21,25 @@ class BosqueLexer(RegexLexer):
     ]
 
     OTHER_KEYWORDS = [
-        'recursive', 'action', '_debug', 'bsqon', 'example', 'do', 'fail',
+        'recursive', 'action', '_debug', 'bsqon', 'do', 'fail',
         'implements', 'debug', 'release', 'safety', 'spec', 'test', 'api',
-        'as', 'concept', 'const', 'declare', 'enum', 'entity', 'ensures',
-        'field', 'function', 'invariant', 'method', 'namespace', 'of',
-        'provides', 'requires', 'in', 'task', 'datatype', 'using', 'validate',
-        'when', 'event', 'status', 'resource', 'predicate', 'softcheck',
-        'errtest', 'chektest', 'operator', 'variant'
+        'as', 'concept', 'const', 'declare', 'enum', 'entity',
+        'field', 'function', 'method', 'namespace', 'of',
+        'provides', 'in', 'task', 'datatype', 'using',
+        'when', 'event', 'status', 'resource', 'predicate',
+        'operator', 'variant'
     ]
 
-    # Combine all keywords into a single list
-    KEYWORDS = CONTROL_KEYWORDS + OTHER_KEYWORDS
+    # Combine all keywords into a single de-duplicated list, longest first so
+    # that no keyword is shadowed by one of its prefixes
+    KEYWORDS = sorted(set(CONTROL_KEYWORDS) | set(OTHER_KEYWORDS), key=lambda s: (-len(s), s))
+
+    LANGUAGE_CONSTANTS = [
+        'none', 'true', 'false', 'fail', 'ok', 'some', 'result', 'option',
+        'env', 'this', 'self'
+    ]
 
     # Create regex patterns
-    KEYWORDS_REGEX = r'\b(' + '|'.join(KEYWORDS) + r')\b'
-    CONSTANTS_LANGUAGE_REGEX = r'\b(none|true|false|fail|ok|some|result|option|env|this|self)\b'
     CONSTANTS_NUMERIC_REGEX = r'\b(([0-9]+)[inIN])\b|\b((([0-9]+))[R]|(([0-9]+)/([0-9]+)[R]))\b|\b(([0-9]+\.[0-9]+([eE][-+]?[0-9]+)?[fd]))\b|\b([0-9]+)\b'
     TYPES_REGEX = r'\b((([A-Z][_a-zA-Z0-9]+)::)*([A-Z][_a-zA-Z0-9]+))\b|\b[A-Z]\b'
     VARIABLES_REGEX = r'\b([$]|([$]?([_a-z]|[_a-z][_a-zA-Z0-9]+)))\b'
@@ -45,27 +49,14 @@ class BosqueLexer(RegexLexer):
         'root': [
             (r'\s+', Text),  # Whitespace
 
-            # Single-line comments: %%
-            (r'%%.*$', Comment.Single),
-
-            # Multi-line comments: %** ... *% and %* ... *%
-            (r'%\*\*', Comment.Multiline, 'comment-multiline-double-dash'),
-            (r'%\*', Comment.Multiline, 'comment-multiline'),
-
-            # Double-quoted strings: "..."
-            (r'"', String.Double, 'string-double'),
-
-            # Single-quoted strings: '...'
-            (r"'", String.Single, 'string-single'),
-
-            # Keywords
-            (KEYWORDS_REGEX, Keyword),
+            # Keywords (words() builds a prefix-factored alternation)
+            (words(KEYWORDS, prefix=r'\b', suffix=r'\b'), Keyword),
 
             # Language Constants
-            (CONSTANTS_LANGUAGE_REGEX, Constant.Language),
+            (words(LANGUAGE_CONSTANTS, prefix=r'\b', suffix=r'\b'), Keyword.Constant),
 
             # Numeric Constants
-            (CONSTANTS_NUMERIC_REGEX, Constant.Numeric),
+            (CONSTANTS_NUMERIC_REGEX, Number),
 
             # Types
             (TYPES_REGEX, Name.Class),
@@ -76,6 +67,18 @@ class BosqueLexer(RegexLexer):
             # Function names (identifier followed by '(')
             (FUNCTION_NAME_REGEX, Name.Function),
 
+            # Single-line comments: %%
+            (r'%%.*$', Comment.Single),
+
+            # Multi-line comments: %** ... *% and %* ... *%
+            (r'%\*\*?', Comment.Multiline, 'comment-multiline'),
+
+            # Double-quoted strings: "..."
+            (r'"', String.Double, 'string-double'),
+
+            # Single-quoted strings: '...'
+            (r"'", String.Single, 'string-single'),
+
             # Operators
             (r'[+\-*/=<>!]+', Operator),
 
@@ -83,14 +86,7 @@ class BosqueLexer(RegexLexer):
             (r'[{}()\[\];,]', Punctuation),
         ],
 
-        # Multi-line comment with %**
-        'comment-multiline-double-dash': [
-            (r'\*%', Comment.Multiline, '#pop'),
-            (r'[^*%]+', Comment.Multiline),
-            (r'[*/%]+', Comment.Multiline),
-        ],
-
-        # Multi-line comment with %*
+        # Multi-line comment body, shared by %** and %* comments
         'comment-multiline': [
             (r'\*%', Comment.Multiline, '#pop'),
             (r'[^*%]+', Comment.Multiline),
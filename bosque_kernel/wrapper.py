@@ -1,6 +1,77 @@
 import subprocess
+import asyncio
+import hashlib
+import json
+import logging
 import os
-from pathlib import Path
+import shutil
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Persistent on-disk tier of the compiled-output cache
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'bosque_kernel'
+)
+
+# Bootstrap for the long-lived Node.js worker. Each line on stdin is a JSON
+# request {js_path, cwd}. The module is imported in a fresh worker thread, so
+# every run gets its own module graph and globals, and the run only ends once
+# the thread's event loop is empty or it calls process.exit(). Writes to
+# stdout are forwarded immediately as JSON lines {text}, stderr is captured,
+# and a final JSON line {stderr, rc} marks the end of the run.
+NODE_WORKER_BOOTSTRAP = r"""
+const readline = require('readline');
+const { Worker } = require('worker_threads');
+const { pathToFileURL } = require('url');
+
+const RUNNER_SOURCE = "import(require('worker_threads').workerData.url);";
+
+const reply = (message) => process.stdout.write(JSON.stringify(message) + '\n');
+const ended = (stream) => new Promise((resolve) => stream.on('end', resolve));
+
+function run(line) {
+    const request = JSON.parse(line);
+    const stderr = [];
+    try {
+        // Worker threads share the process cwd and cannot change it themselves
+        if (request.cwd && request.cwd !== process.cwd()) process.chdir(request.cwd);
+        const worker = new Worker(RUNNER_SOURCE, {
+            eval: true,
+            workerData: { url: pathToFileURL(request.js_path).href },
+            stdout: true,
+            stderr: true
+        });
+        worker.stdout.setEncoding('utf8');
+        worker.stderr.setEncoding('utf8');
+        worker.stdout.on('data', (text) => reply({ text: text }));
+        worker.stderr.on('data', (text) => stderr.push(text));
+        worker.on('error', (err) => stderr.push(String(err && err.stack || err) + '\n'));
+        const exited = new Promise((resolve) => worker.on('exit', resolve));
+        return Promise.all([exited, ended(worker.stdout), ended(worker.stderr)])
+            .then(([rc]) => reply({ stderr: stderr.join(''), rc: rc }));
+    } catch (err) {
+        stderr.push(String(err && err.stack || err) + '\n');
+        reply({ stderr: stderr.join(''), rc: 1 });
+        return Promise.resolve();
+    }
+}
+
+let queue = Promise.resolve();
+readline.createInterface({ input: process.stdin }).on('line', (line) => {
+    queue = queue.then(() => run(line));
+});
+"""
+
+# Minimal program compiled once at start-up to warm up the compiler
+WARMUP_SOURCE = """namespace Main;
+
+public function main(): Int {
+    return 0i;
+}
+"""
 
 class BosqueExecutionError(Exception):
     """Custom exception for Bosque execution errors."""
@@ -12,58 +83,276 @@ class BosqueWrapper:
     Isolates Bosque-specific logic for easy maintenance and future extensions.
     """
 
-    def __init__(self, bosque_command='bosque', node_command='node', main_js_filename='Main.mjs'):
+    def __init__(self, bosque_command='bosque', node_command='node', main_js_filename='Main.mjs',
+                 cache_dir=DEFAULT_CACHE_DIR, cache_size=64, work_dir=None, warm_up=True):
         """
         Initialize the wrapper with commands to invoke Bosque and Node.js.
 
         :param bosque_command: Command to invoke the Bosque compiler.
         :param node_command: Command to invoke Node.js.
         :param main_js_filename: The expected main JavaScript file name after compilation.
+        :param cache_dir: Directory holding compiled outputs keyed by source hash.
+        :param cache_size: Maximum number of compiled outputs kept in the cache.
+        :param work_dir: Default working directory; its file paths are computed once here.
+        :param warm_up: Compile a stub program in the background when a work_dir is given.
         """
         self.bosque_command = bosque_command
         self.node_command = node_command
         self.main_js_filename = main_js_filename
+        self.cache_dir = cache_dir
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._compiler_path = shutil.which(bosque_command) or bosque_command
+        self._main_js_cache = {}
+        self._node = None
+        self._source_fd = None
+        self._current_proc = None
+        self._warmup_proc = None
+        self._executing = False
+        self._interrupted = False
+
+        self.work_dir = work_dir
+        self.source_path = self.output_dir = None
+        if work_dir is not None:
+            self.source_path = os.path.join(work_dir, 'source.bsq')
+            self.output_dir = os.path.join(work_dir, 'jsout')
+            # Kept open for the wrapper's lifetime; each compile rewrites it in place
+            self._source_fd = os.open(self.source_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            if warm_up:
+                self._start_warmup()
+
+        if cache_size > 0:
+            self._load_cache()
+        self._start_worker()
+
+    def _start_warmup(self):
+        """
+        Compiles a stub program in the background so the first cell does not
+        pay for loading the compiler and its standard library from a cold
+        disk cache. Failures are ignored.
+        """
+        warmup_dir = os.path.join(self.work_dir, 'warmup')
+        warmup_path = os.path.join(warmup_dir, 'source.bsq')
+        try:
+            os.makedirs(warmup_dir, exist_ok=True)
+            with open(warmup_path, 'w') as warmup_file:
+                warmup_file.write(WARMUP_SOURCE)
+            self._warmup_proc = subprocess.Popen(
+                [self.bosque_command, warmup_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=warmup_dir,
+                close_fds=False
+            )
+        except OSError:
+            logger.debug("Compiler warm-up could not be started.", exc_info=True)
+
+    def _reap_warmup(self, cancel=False):
+        """
+        Reaps the warm-up compile once it has finished.
+
+        :param cancel: Kill the warm-up if it is still running, so it does not
+                       compete with a real compile for CPU.
+        """
+        warmup_proc = self._warmup_proc
+        if warmup_proc is None:
+            return
+        if warmup_proc.poll() is None:
+            if not cancel:
+                return
+            warmup_proc.kill()
+            warmup_proc.wait()
+        self._warmup_proc = None
+
+    def _start_worker(self):
+        """
+        Launches the persistent Node.js worker that executes generated JavaScript.
+        """
+        logger.debug("Starting Node.js worker.")
+        self._node = subprocess.Popen(
+            [self.node_command, '-e', NODE_WORKER_BOOTSTRAP],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            bufsize=1
+        )
+
+    def _ensure_worker(self):
+        """
+        Restarts the Node.js worker if it is not running.
+        """
+        if self._node is None or self._node.poll() is not None:
+            self._start_worker()
+
+    def close_worker(self):
+        """
+        Terminates the Node.js worker. Safe to call more than once.
+        """
+        node, self._node = self._node, None
+        if node is None:
+            return
+        try:
+            node.stdin.close()
+            node.terminate()
+            node.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            node.kill()
+
+    def close(self):
+        """
+        Terminates the Node.js worker and any running warm-up compile, and
+        closes the source file. Safe to call more than once.
+        """
+        source_fd, self._source_fd = self._source_fd, None
+        if source_fd is not None:
+            os.close(source_fd)
+
+        self._reap_warmup(cancel=True)
+
+        self.close_worker()
+
+    def __del__(self):
+        self.close()
+
+    def _compile_paths(self, work_dir):
+        """
+        Resolves the paths used to compile Bosque code in the given work directory.
+
+        :return: Tuple of (work_dir, source_file_path, output_dir).
+        :raises BosqueExecutionError: If neither work_dir nor the wrapper's work directory is set.
+        """
+        if work_dir is None and self.work_dir is None:
+            raise BosqueExecutionError("No work directory given and the wrapper has none.")
 
-    def compile_bosque(self, bosque_code, work_dir):
+        # Reuse the precomputed paths for the wrapper's own work directory
+        if work_dir is None or work_dir == self.work_dir:
+            work_dir = self.work_dir
+            source_file_path = self.source_path
+            output_dir = self.output_dir
+        else:
+            source_file_path = os.path.join(work_dir, 'source.bsq')
+            output_dir = os.path.join(work_dir, 'jsout')
+
+        return work_dir, source_file_path, output_dir
+
+    def _prepare_compile(self, bosque_code, source_file_path, output_dir):
+        """
+        Writes the Bosque code to source.bsq and clears the previous output.
+        """
+        self._reap_warmup(cancel=True)
+
+        # Write the Bosque code to the source.bsq file, overwriting the previous cell
+        if self._source_fd is not None and source_file_path == self.source_path:
+            os.lseek(self._source_fd, 0, os.SEEK_SET)
+            os.ftruncate(self._source_fd, 0)
+            os.write(self._source_fd, bosque_code.encode('utf-8'))
+        else:
+            with open(source_file_path, 'w') as source_file:
+                source_file.write(bosque_code)
+
+        # Drop the previous cell's output (jsout in the same directory as
+        # source.bsq) so stale modules are not picked up
+        if os.path.isdir(output_dir):
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+    def _check_compile(self, returncode, compile_stderr, output_dir):
+        """
+        Raises BosqueExecutionError unless the compiler run produced output.
+        """
+        if self._interrupted:
+            raise BosqueExecutionError("Compilation interrupted.")
+
+        if returncode != 0:
+            error_msg = compile_stderr.strip() or 'Unknown compilation error.'
+            raise BosqueExecutionError(f"Compilation failed: {error_msg}")
+
+        if not os.path.isdir(output_dir):
+            raise BosqueExecutionError(f"Compilation succeeded but output directory '{output_dir}' was not found.")
+
+    def compile_bosque(self, bosque_code, work_dir=None):
         """
         Compiles Bosque code to JavaScript using the Bosque compiler.
 
         :param bosque_code: A string containing Bosque code.
-        :param work_dir: The working directory to execute commands in.
+        :param work_dir: The working directory to execute commands in (defaults to the wrapper's).
         :return: Path to the output directory containing generated JavaScript files.
         :raises BosqueExecutionError: If compilation fails.
         """
-        # Determine the source file path
-        source_file_path = os.path.join(work_dir, 'source.bsq')
+        work_dir, source_file_path, output_dir = self._compile_paths(work_dir)
+        self._prepare_compile(bosque_code, source_file_path, output_dir)
 
-        # Write the Bosque code to the source.bsq file
-        with open(source_file_path, 'w') as source_file:
-            source_file.write(bosque_code)
-
-        # Determine the output directory (jsout in the same directory as source.bsq)
-        output_dir = os.path.join(work_dir, 'jsout')
-        os.makedirs(output_dir, exist_ok=True)
-
-        # Compile Bosque code
-        compile_proc = subprocess.run(
+        # Compile Bosque code. Descriptors opened by Python are non-inheritable,
+        # so close_fds=False only skips the child's close-everything pass.
+        compile_proc = self._current_proc = subprocess.Popen(
             [self.bosque_command, source_file_path],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            cwd=work_dir
+            cwd=work_dir,
+            close_fds=False
         )
 
-        # Remove the source.bsq file after compilation
-        os.remove(source_file_path)
+        # While the compiler runs, make sure a Node.js worker is ready to
+        # execute its output
+        self._ensure_worker()
 
-        if compile_proc.returncode != 0:
-            error_msg = compile_proc.stderr.strip() or 'Unknown compilation error.'
-            raise BosqueExecutionError(f"Compilation failed: {error_msg}")
+        try:
+            _, compile_stderr = compile_proc.communicate()
+        finally:
+            self._current_proc = None
 
-        if not os.path.isdir(output_dir):
-            raise BosqueExecutionError(f"Compilation succeeded but output directory '{output_dir}' was not found.")
+        self._check_compile(compile_proc.returncode, compile_stderr, output_dir)
+        return output_dir
 
+    async def compile_bosque_async(self, bosque_code, work_dir=None):
+        """
+        Compiles Bosque code to JavaScript without blocking the event loop.
+
+        :param bosque_code: A string containing Bosque code.
+        :param work_dir: The working directory to execute commands in (defaults to the wrapper's).
+        :return: Path to the output directory containing generated JavaScript files.
+        :raises BosqueExecutionError: If compilation fails.
+        """
+        work_dir, source_file_path, output_dir = self._compile_paths(work_dir)
+        self._prepare_compile(bosque_code, source_file_path, output_dir)
+
+        # Compile Bosque code (see compile_bosque for close_fds)
+        compile_proc = self._current_proc = await asyncio.create_subprocess_exec(
+            self.bosque_command, source_file_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=work_dir,
+            close_fds=False
+        )
+
+        # While the compiler runs, make sure a Node.js worker is ready to
+        # execute its output
+        self._ensure_worker()
+
+        try:
+            _, compile_stderr = await compile_proc.communicate()
+        finally:
+            self._current_proc = None
+
+        self._check_compile(compile_proc.returncode, compile_stderr.decode(errors='replace'), output_dir)
         return output_dir
 
+    def interrupt(self):
+        """
+        Stops the compilation or execution currently in progress, if any.
+        """
+        self._interrupted = True
+        proc = self._current_proc
+        if proc is not None:
+            try:
+                proc.terminate()
+            except ProcessLookupError:
+                pass
+        elif self._executing:
+            # Killing the worker ends the run; the next execution starts a fresh one
+            self.close_worker()
+
     def find_main_js(self, output_dir):
         """
         Identifies the main JavaScript file to execute.
@@ -74,51 +363,256 @@ class BosqueWrapper:
         """
         main_js_path = os.path.join(output_dir, self.main_js_filename)
         if not os.path.isfile(main_js_path):
-            # Attempt to find any .mjs or .js file as a fallback
-            js_files = list(Path(output_dir).glob('*.mjs')) + list(Path(output_dir).glob('*.js'))
-            if js_files:
-                main_js_path = str(js_files[0])
-            else:
+            main_js_path = self._find_fallback_js(output_dir)
+            if main_js_path is None:
                 raise BosqueExecutionError(f"Main JavaScript file '{self.main_js_filename}' not found in '{output_dir}'.")
 
         return main_js_path
 
-    def execute_js(self, js_path, work_dir):
+    def _find_fallback_js(self, output_dir):
+        """
+        Picks any .mjs (preferred) or .js file in output_dir, remembering the
+        choice until the directory is modified.
+
+        :return: Path to the JavaScript file, or None if there is none.
         """
-        Executes the generated JavaScript file using Node.js.
+        try:
+            mtime = os.stat(output_dir).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        cached = self._main_js_cache.get(output_dir)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        main_js_path = fallback_js_path = None
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.mjs') and entry.is_file():
+                    main_js_path = entry.path
+                    break
+                if fallback_js_path is None and entry.name.endswith('.js') and entry.is_file():
+                    fallback_js_path = entry.path
+        main_js_path = main_js_path or fallback_js_path
+
+        if main_js_path is not None:
+            self._main_js_cache[output_dir] = (mtime, main_js_path)
+        return main_js_path
+
+    def execute_js(self, js_path, work_dir, on_line=None):
+        """
+        Executes the generated JavaScript file in the persistent Node.js worker.
 
         :param js_path: Path to the JavaScript file.
         :param work_dir: The working directory to execute commands in.
-        :return: The standard output from the execution.
+        :param on_line: Optional callback receiving standard output as it is produced.
+        :return: The standard output from the execution, or '' if it was passed to on_line.
         :raises BosqueExecutionError: If execution fails.
         """
-        execute_proc = subprocess.run(
-            [self.node_command, js_path],
-            capture_output=True,
-            text=True,
-            cwd=work_dir
-        )
+        # An interrupt that arrived between compiling and starting the run
+        if self._interrupted:
+            raise BosqueExecutionError("Execution interrupted.")
+
+        self._ensure_worker()
+        node = self._node
 
-        if execute_proc.returncode != 0:
-            error_msg = execute_proc.stderr.strip() or 'Unknown execution error.'
+        output = []
+        request = json.dumps({'js_path': os.path.abspath(js_path), 'cwd': work_dir})
+        self._executing = True
+        try:
+            node.stdin.write(request + '\n')
+            node.stdin.flush()
+            while True:
+                message = node.stdout.readline()
+                if not message:
+                    break
+                result = json.loads(message)
+                if 'text' not in result:
+                    break
+                if on_line is not None:
+                    on_line(result['text'])
+                else:
+                    output.append(result['text'])
+        except (json.JSONDecodeError, UnicodeDecodeError) as error:
+            logger.exception("Unreadable reply from the Node.js worker.")
+            self.close_worker()
+            raise BosqueExecutionError(f"Execution failed: unreadable reply from Node.js worker ({error}).") from error
+        except (OSError, ValueError):
+            # ValueError: the worker's pipes were closed by interrupt()
+            message = ''
+        finally:
+            self._executing = False
+
+        if not message:
+            # The worker died mid-run; the next execution starts a fresh one
+            self.close_worker()
+            if self._interrupted:
+                raise BosqueExecutionError("Execution interrupted.")
+            raise BosqueExecutionError("Execution failed: Node.js worker exited unexpectedly.")
+
+        if result['rc'] != 0:
+            error_msg = result['stderr'].strip() or 'Unknown execution error.'
             raise BosqueExecutionError(f"Execution failed: {error_msg}")
 
-        return execute_proc.stdout
+        return ''.join(output)
 
-    def compile_and_execute(self, bosque_code, work_dir):
+    def compile_and_execute(self, bosque_code, work_dir=None, on_line=None):
         """
         Compiles and executes Bosque code.
 
         :param bosque_code: The Bosque code to execute.
-        :param work_dir: The working directory to execute commands in.
-        :return: The standard output from execution.
+        :param work_dir: The working directory to execute commands in (defaults to the wrapper's).
+        :param on_line: Optional callback receiving standard output as it is produced.
+        :return: The standard output from execution, or '' if it was passed to on_line.
         :raises BosqueExecutionError: If compilation or execution fails.
         """
-        output_dir = self.compile_bosque(bosque_code, work_dir)
+        self._interrupted = False
+        self._reap_warmup()
+        output_dir = self.cached_output_dir(bosque_code)
+        compiled = output_dir is None
+        if compiled:
+            output_dir = self.compile_bosque(bosque_code, work_dir)
         main_js = self.find_main_js(output_dir)
-        output = self.execute_js(main_js, work_dir)
+        try:
+            output = self.execute_js(main_js, work_dir or self.work_dir, on_line=on_line)
+        finally:
+            # Run the fresh output where it was compiled, then keep a copy
+            if compiled:
+                self.cache_output_dir(bosque_code, output_dir)
         return output
 
+    async def compile_and_execute_async(self, bosque_code, work_dir=None, on_line=None):
+        """
+        Compiles and executes Bosque code without blocking the event loop.
+
+        The compiler runs as an asyncio subprocess; the exchange with the
+        Node.js worker runs in the loop's default executor, so on_line may be
+        called from a worker thread.
+
+        :param bosque_code: The Bosque code to execute.
+        :param work_dir: The working directory to execute commands in (defaults to the wrapper's).
+        :param on_line: Optional callback receiving standard output as it is produced.
+        :return: The standard output from execution, or '' if it was passed to on_line.
+        :raises BosqueExecutionError: If compilation or execution fails.
+        """
+        self._interrupted = False
+        self._reap_warmup()
+        output_dir = self.cached_output_dir(bosque_code)
+        compiled = output_dir is None
+        if compiled:
+            output_dir = await self.compile_bosque_async(bosque_code, work_dir)
+        main_js = self.find_main_js(output_dir)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                None, lambda: self.execute_js(main_js, work_dir or self.work_dir, on_line=on_line)
+            )
+        finally:
+            # Run the fresh output where it was compiled, then keep a copy
+            if compiled:
+                self.cache_output_dir(bosque_code, output_dir)
+
+    def _cache_key(self, bosque_code):
+        """
+        Hashes the Bosque source (and the compiler it is built with) into a cache key.
+
+        The compiler's size and mtime are part of the key, so upgrading Bosque
+        in place invalidates earlier output.
+        """
+        try:
+            compiler_stat = os.stat(self._compiler_path)
+            compiler_id = f"{self._compiler_path}:{compiler_stat.st_size}:{compiler_stat.st_mtime_ns}"
+        except OSError:
+            compiler_id = self._compiler_path
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(compiler_id.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(bosque_code.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _load_cache(self):
+        """
+        Registers the entries left in cache_dir by earlier sessions, least
+        recently used first, and prunes them down to cache_size.
+        """
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                existing = [(entry.stat().st_mtime_ns, entry.name, os.path.join(entry.path, 'jsout'))
+                            for entry in entries if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            return
+
+        for _, key, cached_dir in sorted(existing):
+            self._cache[key] = cached_dir
+        self._evict()
+
+    def cached_output_dir(self, bosque_code):
+        """
+        Looks up previously compiled output for the given Bosque code.
+
+        :param bosque_code: The Bosque code to look up.
+        :return: Path to the cached output directory, or None on a cache miss.
+        """
+        if self.cache_size <= 0:
+            return None
+
+        key = self._cache_key(bosque_code)
+        output_dir = self._cache.get(key) or os.path.join(self.cache_dir, key, 'jsout')
+        if not os.path.isdir(output_dir):
+            self._cache.pop(key, None)
+            return None
+
+        logger.debug("Using cached compiler output %s", output_dir)
+        try:
+            # Record the use so later sessions load the entries in LRU order
+            os.utime(os.path.join(self.cache_dir, key))
+        except OSError:
+            pass
+        self._cache[key] = output_dir
+        self._cache.move_to_end(key)
+        self._evict()
+        return output_dir
+
+    def cache_output_dir(self, bosque_code, output_dir):
+        """
+        Copies freshly compiled output into the cache.
+
+        :param bosque_code: The Bosque code the output was compiled from.
+        :param output_dir: Directory containing the generated JavaScript files.
+        :return: Path to the cached copy, or output_dir if it could not be cached.
+        """
+        if self.cache_size <= 0:
+            return output_dir
+
+        key = self._cache_key(bosque_code)
+        cached_dir = os.path.join(self.cache_dir, key, 'jsout')
+        staging_dir = f"{cached_dir}.{os.getpid()}.tmp"
+        try:
+            # Copy next to the final location, then rename so a half-written
+            # entry is never picked up by another lookup
+            shutil.copytree(output_dir, staging_dir)
+            os.rename(staging_dir, cached_dir)
+        except OSError:
+            # Another kernel may have published the same entry first
+            if not os.path.isdir(cached_dir):
+                return output_dir
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        self._cache[key] = cached_dir
+        self._cache.move_to_end(key)
+        self._evict()
+        return cached_dir
+
+    def _evict(self):
+        """
+        Drops the least recently used cache entries beyond cache_size.
+        """
+        while len(self._cache) > self.cache_size:
+            key, _ = self._cache.popitem(last=False)
+            shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+
     def compile_bosque_future(self, bosque_code, work_dir):
         """
         Future-proof method to compile Bosque code.
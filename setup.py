@@ -1,8 +1,9 @@
 import logging
+import shutil
+import sys
 from pathlib import Path
 from setuptools import setup, find_packages
 from setuptools.command.install import install
-from jupyter_client.kernelspec import KernelSpecManager
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,9 +19,15 @@ class PostInstallCommand(install):
             logger.error("Kernel spec directory not found.")
             return
         try:
-            km = KernelSpecManager()
-            km.install_kernel_spec(str(kernel_spec_dir), 'bosque', user=False, replace=True)
-            logger.info("Bosque Jupyter kernel installed successfully.")
+            if self.user:
+                from jupyter_core.paths import jupyter_data_dir
+                data_dir = Path(jupyter_data_dir())
+            else:
+                data_dir = Path(sys.prefix) / 'share' / 'jupyter'
+            dest = data_dir / 'kernels' / 'bosque'
+            dest.mkdir(parents=True, exist_ok=True)
+            shutil.copytree(kernel_spec_dir, dest, dirs_exist_ok=True)
+            logger.info("Bosque Jupyter kernel installed successfully at %s.", dest)
         except Exception:
             logger.exception("Failed to install Bosque Jupyter kernel")
 